@@ -3,11 +3,16 @@ Badge display receiver - copy this to your Badger2040 as main.py
 
 This receives pre-rendered images from your Mac over serial,
 so you can update the display design without reflashing the badge.
+
+Images arrive as raw binary, which can contain Ctrl-C (0x03), so Ctrl-C
+is disabled while this runs. To stop it (e.g. to use Thonny), reset the badge.
 """
 import badger2040
 import sys
 import select
+import struct
 import binascii
+import micropython
 
 # Display setup
 display = badger2040.Badger2040()
@@ -16,9 +21,9 @@ display.set_update_speed(badger2040.UPDATE_FAST)
 WIDTH = 296
 HEIGHT = 128
 
-# Full refresh counter to prevent ghosting
-FULL_REFRESH_INTERVAL = 60
-update_count = 0
+# Set by the host's MODE:NORMAL command to make the next image a full,
+# normal-speed refresh that clears ghosting
+normal_update_pending = False
 
 
 def show_waiting_screen():
@@ -31,74 +36,168 @@ def show_waiting_screen():
     display.update()
 
 
-def display_image(img_bytes):
-    """Display raw 1-bit image data on the screen."""
-    global update_count
+def display_image(img_bytes, x=0, y=0, w=WIDTH, h=HEIGHT):
+    """Display raw 1-bit image data on the screen, or within a region of it."""
+    global normal_update_pending
 
     display.set_pen(15)
-    display.clear()
+    display.rectangle(x, y, w, h)
     display.set_pen(0)
 
-    byte_idx = 0
-    for y in range(HEIGHT):
-        for x in range(0, WIDTH, 8):
-            if byte_idx < len(img_bytes):
-                byte = img_bytes[byte_idx]
+    # Draw runs of black pixels as single rectangles rather than pixel by
+    # pixel. All-white and all-black bytes are handled without touching bits.
+    rectangle = display.rectangle
+    data = memoryview(img_bytes)
+    row_bytes = w // 8
+    for row in range(h):
+        py = y + row
+        run_start = -1
+        px = x
+        for byte in data[row * row_bytes:(row + 1) * row_bytes]:
+            if byte == 0xFF:
+                if run_start >= 0:
+                    rectangle(run_start, py, px - run_start, 1)
+                    run_start = -1
+            elif byte == 0x00:
+                if run_start < 0:
+                    run_start = px
+            else:
                 for bit in range(8):
-                    px = x + bit
-                    if px < WIDTH:
-                        # Check if pixel is black (bit is 0)
-                        if not (byte & (1 << (7 - bit))):
-                            display.set_pen(0)
-                            display.pixel(px, y)
-                byte_idx += 1
-
-    # Full refresh periodically to prevent ghosting
-    update_count += 1
-    if update_count >= FULL_REFRESH_INTERVAL:
+                    # Pixel is black when its bit is 0
+                    if byte & (0x80 >> bit):
+                        if run_start >= 0:
+                            rectangle(run_start, py, px + bit - run_start, 1)
+                            run_start = -1
+                    elif run_start < 0:
+                        run_start = px + bit
+            px += 8
+        if run_start >= 0:
+            rectangle(run_start, py, px - run_start, 1)
+
+    if normal_update_pending:
         display.set_update_speed(badger2040.UPDATE_NORMAL)
         display.update()
         display.set_update_speed(badger2040.UPDATE_FAST)
-        update_count = 0
+        normal_update_pending = False
+    elif w == WIDTH and h == HEIGHT:
+        display.update()
     else:
+        display.partial_update(x, y, w, h)
+
+
+def read_binary(header_format):
+    """Read a binary header and the payload whose length it ends with."""
+    header = struct.unpack(header_format, stdin.read(struct.calcsize(header_format)))
+    payload = stdin.read(header[-1])
+    stdin.read(1)  # Trailing newline
+    return header[:-1], payload
+
+
+def handle_line(line):
+    """Handle a complete text command."""
+    global normal_update_pending
+
+    if line.startswith(b"IMG:"):
+        try:
+            # Decode base64 image data
+            encoded_data = line[4:]
+            img_bytes = binascii.a2b_base64(encoded_data)
+            display_image(img_bytes)
+            print("Image displayed")
+        except Exception as e:
+            print(f"Error: {e}")
+
+    elif line == b"MODE:NORMAL":
+        normal_update_pending = True
+
+    # Keep backward compatibility with text-only mode
+    elif line.startswith(b"CO2:"):
+        co2_level = line.split(b":")[1].decode()
+        display.set_pen(15)
+        display.clear()
+        display.set_pen(0)
+        display.set_font("bitmap8")
+        display.text("Room CO2 Level", 10, 10, scale=2)
+        display.text(co2_level, 30, 50, scale=4)
+        display.text("ppm", 30, 90, scale=2)
         display.update()
 
 
+def rle_decode(data, size):
+    """Expand PackBits-style run-length encoded data into a buffer of the given size."""
+    img_bytes = bytearray(size)
+    pos = 0
+    i = 0
+    while i < len(data):
+        control = data[i]
+        if control < 128:
+            # Literal bytes
+            count = control + 1
+            img_bytes[pos:pos + count] = data[i + 1:i + 1 + count]
+            i += 1 + count
+        else:
+            # One byte repeated
+            count = 257 - control
+            img_bytes[pos:pos + count] = bytes((data[i + 1],)) * count
+            i += 2
+        pos += count
+    return img_bytes
+
+
 # Show initial screen
 show_waiting_screen()
 
-# Buffer for incoming data
-buffer = ""
+# Buffer for the start of an incoming command. Only the command tag is read
+# a byte at a time; the rest is read in one call once the tag is known.
+buffer = bytearray()
+stdin = sys.stdin.buffer
+
+# Binary frames can contain Ctrl-C (0x03), and USB serial checks for it as each
+# byte arrives, before the frame is read. Disable it so those bytes reach stdin
+# intact instead of raising KeyboardInterrupt. Stopping the program now needs a reset.
+micropython.kbd_intr(-1)
 
 print("Badge ready - listening for images...")
 
 while True:
     if sys.stdin in select.select([sys.stdin], [], [], 0.1)[0]:
-        char = sys.stdin.read(1)
-        if char == "\n":
-            line = buffer.strip()
-            buffer = ""
-
-            if line.startswith("IMG:"):
-                try:
-                    # Decode base64 image data
-                    encoded_data = line[4:]
-                    img_bytes = binascii.a2b_base64(encoded_data)
-                    display_image(img_bytes)
-                    print("Image displayed")
-                except Exception as e:
-                    print(f"Error: {e}")
-
-            # Keep backward compatibility with text-only mode
-            elif line.startswith("CO2:"):
-                co2_level = line.split(":")[1]
-                display.set_pen(15)
-                display.clear()
-                display.set_pen(0)
-                display.set_font("bitmap8")
-                display.text("Room CO2 Level", 10, 10, scale=2)
-                display.text(co2_level, 30, 50, scale=4)
-                display.text("ppm", 30, 90, scale=2)
-                display.update()
-        else:
-            buffer += char
+        char = stdin.read(1)
+        if char == b"\n":
+            handle_line(bytes(buffer).strip())
+            buffer = bytearray()
+            continue
+
+        buffer.extend(char)
+
+        # Known text commands: read the rest of the line in one go
+        if buffer == b"IMG:" or buffer == b"MODE:" or buffer == b"CO2:":
+            line = bytes(buffer) + stdin.readline()
+            buffer = bytearray()
+            handle_line(line.strip())
+
+        # Binary frames carry their length, so read them in one go.
+        # IMGR and IMPR are the run-length encoded forms of IMGB and IMGP.
+        elif buffer == b"IMGB:" or buffer == b"IMGR:":
+            compressed = buffer == b"IMGR:"
+            buffer = bytearray()
+            try:
+                _, img_bytes = read_binary(">H")
+                if compressed:
+                    img_bytes = rle_decode(img_bytes, WIDTH // 8 * HEIGHT)
+                display_image(img_bytes)
+                print("Image displayed")
+            except Exception as e:
+                print(f"Error: {e}")
+
+        elif buffer == b"IMGP:" or buffer == b"IMPR:":
+            compressed = buffer == b"IMPR:"
+            buffer = bytearray()
+            try:
+                # Patch of a region: x, y, w, h then the payload length
+                region, img_bytes = read_binary(">HHHHH")
+                if compressed:
+                    img_bytes = rle_decode(img_bytes, region[2] // 8 * region[3])
+                display_image(img_bytes, *region)
+                print("Patch displayed")
+            except Exception as e:
+                print(f"Error: {e}")
@@ -1,11 +1,15 @@
-import base64
+import asyncio
+import math
 import os
 import serial
+import struct
 import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from dotenv import load_dotenv
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 
 load_dotenv()
 
@@ -29,11 +33,14 @@ DISPLAY_CONFIG = {
     },
 }
 
+# Frames between full (non-fast) refreshes, which clear e-ink ghosting
+FULL_REFRESH_INTERVAL = 60
+
 # Cell definitions: each cell has position, sensor key, icon, formatting, and thresholds
 # Thresholds: [warning_threshold, danger_threshold] or None for no warnings
 # icon_y_offset: fine-tune vertical icon position (positive = down, negative = up)
 ICONS_DIR = "./icons/PNG/for-light-mode/24px/solid"
-ICONS_DIR_DARK = "./icons/PNG/for-dark-mode/24px/solid"
+ICON_CACHE_DIR = "./.cache/icons"  # Pre-rendered 1-bit icons, rebuilt when the source PNG changes
 GRID_CONFIG = [
     # Row 0
     {"row": 0, "col": 0, "sensor": "co2", "icon": "seedlings.png", "format": "int", "thresholds": [1000, 2000]},
@@ -75,6 +82,21 @@ headers = {
     "Content-Type": "application/json",
 }
 
+# Shared session so polls reuse kept-alive connections to Home Assistant,
+# with enough pooled connections for every concurrent fetch
+session = requests.Session()
+session.headers.update(headers)
+_adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=len(SENSOR_ENTITIES) + 1)
+session.mount("http://", _adapter)
+session.mount("https://", _adapter)
+
+
+# Last successfully fetched values, shown instead of "ERR" when a fetch fails
+_last_good_values = {}
+
+# States Home Assistant reports when an entity has no real value
+UNAVAILABLE_STATES = ("unavailable", "unknown")
+
 
 def get_sensor_value(entity_id):
     """Fetch a sensor value from Home Assistant."""
@@ -82,40 +104,52 @@ def get_sensor_value(entity_id):
         return "ERR"
     try:
         url = f"{HA_URL}/api/states/{entity_id}"
-        response = requests.get(url, headers=headers, timeout=5)
+        response = session.get(url, timeout=5)
         response.raise_for_status()
         data = response.json()
-        return data["state"]
+        state = data["state"]
+        if state in UNAVAILABLE_STATES:
+            return _last_good_values.get(entity_id, state)
+        _last_good_values[entity_id] = state
+        return state
     except Exception as e:
         print(f"Error fetching {entity_id}: {e}")
-        return "ERR"
+        return _last_good_values.get(entity_id, "ERR")
 
 
 def get_weather_temperature():
     """Fetch temperature from weather entity attributes."""
     if not WEATHER_ENTITY:
         return "ERR"
+    cache_key = (WEATHER_ENTITY, "temperature")
     try:
         url = f"{HA_URL}/api/states/{WEATHER_ENTITY}"
-        response = requests.get(url, headers=headers, timeout=5)
+        response = session.get(url, timeout=5)
         response.raise_for_status()
         data = response.json()
-        return data["attributes"].get("temperature", "ERR")
+        temperature = data["attributes"].get("temperature")
+        if temperature is None:
+            # The attribute is missing while the weather entity is unavailable
+            return _last_good_values.get(cache_key, "ERR")
+        _last_good_values[cache_key] = temperature
+        return temperature
     except Exception as e:
         print(f"Error fetching weather: {e}")
-        return "ERR"
+        return _last_good_values.get(cache_key, "ERR")
 
 
 def fetch_all_sensors():
     """Fetch all configured sensor values."""
     from datetime import datetime
 
-    sensor_data = {}
-    for key, entity in SENSOR_ENTITIES.items():
-        sensor_data[key] = get_sensor_value(entity)
+    # Fetch every entity concurrently so the cycle costs one round-trip, not one per sensor
+    with ThreadPoolExecutor(max_workers=len(SENSOR_ENTITIES) + 1) as executor:
+        futures = {key: executor.submit(get_sensor_value, entity) for key, entity in SENSOR_ENTITIES.items()}
 
-    # Fetch outside temperature from weather entity
-    sensor_data["outside_temp"] = get_weather_temperature()
+        # Fetch outside temperature from weather entity
+        futures["outside_temp"] = executor.submit(get_weather_temperature)
+
+        sensor_data = {key: future.result() for key, future in futures.items()}
 
     # Add local time and date
     now = datetime.now()
@@ -129,19 +163,58 @@ def fetch_all_sensors():
 # DISPLAY RENDERING
 # =============================================================================
 
-# Icon cache to avoid reloading
+# Load the font once rather than for every frame
+try:
+    TEXT_FONT = ImageFont.truetype(DISPLAY_CONFIG["fonts"]["text"]["path"], DISPLAY_CONFIG["fonts"]["text"]["size"])
+except OSError:
+    TEXT_FONT = ImageFont.load_default()
+
+
+def build_glyphs(font, chars):
+    """Prerender each character to a 1-bit mask, paired with its advance width."""
+    glyphs = {}
+    for ch in chars:
+        _, _, right, bottom = font.getbbox(ch)
+        mask = Image.new("1", (max(right, 1), max(bottom, 1)), 0)
+        ImageDraw.Draw(mask).text((0, 0), ch, font=font, fill=1)
+        glyphs[ch] = (mask, round(font.getlength(ch)))
+    return glyphs
+
+
+# Glyphs for numeric values, times and dates, pasted instead of rasterized every frame
+GLYPHS = build_glyphs(TEXT_FONT, "0123456789:/%°.C-")
+
+# Icon caches to avoid reloading
 _icon_cache = {}
+_inverted_icon_cache = {}
 
 
 def load_icon(icon_name, size, invert=False):
-    """Load and resize an icon, using dark mode icons when inverted."""
-    cache_key = (icon_name, size, invert)
+    """Load and resize an icon, inverted to white on black if requested."""
+    cache_key = (icon_name, size)
+    if invert:
+        # Inverted (danger) icons are derived from the normal icon
+        if cache_key not in _inverted_icon_cache:
+            icon = load_icon(icon_name, size)
+            _inverted_icon_cache[cache_key] = ImageChops.invert(icon) if icon else None
+        return _inverted_icon_cache[cache_key]
+
     if cache_key in _icon_cache:
         return _icon_cache[cache_key]
 
-    # Use dark mode icons for inverted (danger) state
-    icons_dir = ICONS_DIR_DARK if invert else ICONS_DIR
-    icon_path = os.path.join(icons_dir, icon_name)
+    icon_path = os.path.join(ICONS_DIR, icon_name)
+    cache_path = os.path.join(ICON_CACHE_DIR, f"{os.path.splitext(icon_name)[0]}.{size}.pbm")
+
+    # Reuse the pre-rendered icon from disk if it's newer than its source PNG
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(icon_path):
+            result = Image.open(cache_path)
+            result.load()
+            _icon_cache[cache_key] = result
+            return result
+    except OSError:
+        pass
+
     try:
         icon = Image.open(icon_path).convert("RGBA")
 
@@ -152,10 +225,8 @@ def load_icon(icon_name, size, invert=False):
         new_h = int(orig_h * scale)
         icon = icon.resize((new_w, new_h), Image.Resampling.NEAREST)
 
-        # Convert to 1-bit with transparency handling
-        # Create a black background for inverted, white for normal
-        bg_color = 0 if invert else 255
-        bg = Image.new("L", icon.size, bg_color)
+        # Convert to 1-bit with transparency handling, on a white background
+        bg = Image.new("L", icon.size, 255)
 
         # Get alpha channel and image data
         alpha = icon.split()[3]
@@ -167,6 +238,12 @@ def load_icon(icon_name, size, invert=False):
         # Convert to 1-bit
         result = bg.point(lambda x: 0 if x < 128 else 255, mode="1")
 
+        try:
+            os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+            result.save(cache_path)
+        except OSError as e:
+            print(f"Error caching icon {icon_name}: {e}")
+
         _icon_cache[cache_key] = result
         return result
     except Exception as e:
@@ -174,125 +251,175 @@ def load_icon(icon_name, size, invert=False):
         return None
 
 
-def get_warning_level(value, thresholds):
-    """Return warning level: 0=none, 1=warning, 2=danger."""
-    if not thresholds:
-        return 0
+# Everything about a cell except its value, resolved from GRID_CONFIG once at startup.
+# box is the cell's inclusive [x0, y0, x1, y1] rectangle on the display; local_box and
+# the icon and text positions are relative to the cell, which is drawn as its own image.
+Cell = namedtuple("Cell", [
+    "x", "y", "w", "h", "box", "local_box", "icon_x", "icon_y", "text_x", "text_y",
+    "sensor", "fmt", "suffix", "thresholds", "icon", "inverted_icon",
+])
+
+
+def build_cells():
+    """Precompute the geometry, formatting and icons of every grid cell."""
+    cell_width = DISPLAY_CONFIG["width"] // DISPLAY_CONFIG["cols"]
+    cell_height = DISPLAY_CONFIG["height"] // DISPLAY_CONFIG["rows"]
+    icon_size = DISPLAY_CONFIG["icon_size"]
+
+    cells = []
+    for cell_config in GRID_CONFIG:
+        # Cells fill their full space with no gaps
+        x = cell_config["col"] * cell_width
+        y = cell_config["row"] * cell_height
+
+        # Loading icons here also means the first frame doesn't pay for decoding them.
+        # Only cells with thresholds can be drawn inverted, so only they need the inverted icon.
+        icon_name = cell_config.get("icon")
+        thresholds = cell_config.get("thresholds")
+        icon = load_icon(icon_name, icon_size) if icon_name else None
+        inverted_icon = load_icon(icon_name, icon_size, invert=True) if icon_name and thresholds else None
+
+        cells.append(Cell(
+            x=x,
+            y=y,
+            w=cell_width,
+            h=cell_height,
+            box=[x, y, x + cell_width - 1, y + cell_height - 1],
+            local_box=[0, 0, cell_width - 1, cell_height - 1],
+            icon_x=4,
+            icon_y=(cell_height - icon_size) // 2 + cell_config.get("icon_y_offset", 0),
+            text_x=icon_size + 12,
+            text_y=0,
+            sensor=cell_config.get("sensor"),
+            fmt=cell_config.get("format", "1f"),
+            suffix=cell_config.get("suffix", ""),
+            thresholds=thresholds,
+            icon=icon,
+            inverted_icon=inverted_icon,
+        ))
+    return tuple(cells)
+
+
+# Cells showing a sensor value, and blank cells that only ever show a debug border
+_ALL_CELLS = build_cells()
+_CELLS = tuple(cell for cell in _ALL_CELLS if cell.sensor)
+_BLANK_CELLS = tuple(cell for cell in _ALL_CELLS if not cell.sensor)
+
+
+def prepare_cell(value, fmt, suffix, thresholds):
+    """Format a sensor value for display and return it with its warning level.
+
+    Warning levels are 0=none, 1=warning, 2=danger.
+    """
     try:
         val = float(value)
-        if val >= thresholds[1]:
-            return 2  # danger
-        elif val >= thresholds[0]:
-            return 1  # warning
     except (ValueError, TypeError):
-        pass
-    return 0
+        return f"{value}{suffix}", 0
 
+    warning_level = 0
+    if thresholds:
+        if val >= thresholds[1]:
+            warning_level = 2  # danger
+        elif val >= thresholds[0]:
+            warning_level = 1  # warning
 
-def format_value(value, fmt, suffix=""):
-    """Format a sensor value for display."""
     if fmt == "raw":
-        return f"{value}{suffix}"
-    try:
-        val = float(value)
-        if fmt == "int":
-            return f"{int(val)}{suffix}"
-        elif fmt == "0f":
-            return f"{val:.0f}{suffix}"
-        elif fmt == "1f":
-            return f"{val:.1f}{suffix}"
-        else:
-            return f"{val}{suffix}"
-    except (ValueError, TypeError):
-        return f"{value}{suffix}"
+        return f"{value}{suffix}", warning_level
+    elif fmt == "int":
+        try:
+            return f"{int(val)}{suffix}", warning_level
+        except (ValueError, OverflowError):  # nan or inf
+            return f"{value}{suffix}", warning_level
+    elif fmt == "0f":
+        return f"{val:.0f}{suffix}", warning_level
+    elif fmt == "1f":
+        return f"{val:.1f}{suffix}", warning_level
+    else:
+        return f"{val}{suffix}", warning_level
 
 
-def draw_cell(draw, img, cell_config, sensor_data, cell_width, cell_height, text_font, debug_borders=False):
-    """Draw a single cell in the grid."""
-    col = cell_config["col"]
-    row = cell_config["row"]
+def draw_text(draw, img, xy, text, fill):
+    """Draw text from prerendered glyphs, falling back to the font for other characters."""
+    if not all(ch in GLYPHS for ch in text):
+        draw.text(xy, text, font=TEXT_FONT, fill=fill)
+        return
 
-    # Calculate cell position - cells fill their full space with no gaps
-    x = col * cell_width
-    y = row * cell_height
-    w = cell_width
-    h = cell_height
+    x, y = xy
+    for ch in text:
+        mask, advance = GLYPHS[ch]
+        img.paste(fill, (x, y), mask)
+        x += advance
 
-    # Draw debug border if enabled
-    if debug_borders:
-        draw.rectangle([x, y, x + w - 1, y + h - 1], outline=0, width=1)
 
-    if not cell_config.get("sensor"):
-        return  # blank cell
+def _draw_cell_normal(draw, img, cell, text, warning_level):
+    """Draw a cell black on white, with a border at the warning level."""
+    if warning_level == 1:
+        draw.rectangle(cell.local_box, outline=0, width=2)
+    if cell.icon:
+        img.paste(cell.icon, (cell.icon_x, cell.icon_y))
+    draw_text(draw, img, (cell.text_x, cell.text_y), text, 0)
 
-    # Get sensor value and warning level
-    sensor_key = cell_config["sensor"]
-    value = sensor_data.get(sensor_key, "---")
-    thresholds = cell_config.get("thresholds")
-    warning_level = get_warning_level(value, thresholds)
 
-    # Determine colors based on warning level
-    # 0 = normal (black on white), 1 = warning (border), 2 = danger (inverted)
-    invert = warning_level == 2
-    if invert:
-        fg_color = 1  # white foreground
-        # Fill cell with black
-        draw.rectangle([x, y, x + w, y + h], fill=0)
-    else:
-        fg_color = 0  # black foreground
+def _draw_cell_invert(draw, img, cell, text, warning_level):
+    """Draw a cell white on black, for the danger level."""
+    draw.rectangle(cell.local_box, fill=0)
+    if cell.inverted_icon:
+        img.paste(cell.inverted_icon, (cell.icon_x, cell.icon_y))
+    draw_text(draw, img, (cell.text_x, cell.text_y), text, 1)
 
-    # Draw border for warning level
-    if warning_level == 1:
-        draw.rectangle([x, y, x + w - 1, y + h - 1], outline=0, width=2)
 
-    # Format the value
-    suffix = cell_config.get("suffix", "")
-    formatted_value = format_value(value, cell_config.get("format", "1f"), suffix)
+# Cell drawers indexed by warning level: 0 = normal, 1 = warning (border), 2 = danger (inverted)
+_CELL_DRAWERS = (_draw_cell_normal, _draw_cell_normal, _draw_cell_invert)
 
-    # Load and draw icon
-    icon_name = cell_config.get("icon", "")
-    icon_size = DISPLAY_CONFIG["icon_size"]
-    icon_y_offset = cell_config.get("icon_y_offset", 0)
 
-    if icon_name:
-        icon = load_icon(icon_name, icon_size, invert=invert)
-        if icon:
-            icon_x = x + 4
-            icon_y = y + (h - icon_size) // 2 + icon_y_offset
-            img.paste(icon, (icon_x, icon_y))
+def draw_cell(img, cell, value):
+    """Draw a single cell in the grid, replacing whatever was there before."""
+    text, warning_level = prepare_cell(value, cell.fmt, cell.suffix, cell.thresholds)
 
-    # Draw text
-    text_x = x + icon_size + 12
-    text_y = y
+    # Draw into an image the size of the cell so long text (e.g. "unavailable")
+    # is clipped at the cell edge rather than spilling into its neighbour
+    cell_img = Image.new("1", (cell.w, cell.h), 1)
+    _CELL_DRAWERS[warning_level](ImageDraw.Draw(cell_img), cell_img, cell, text, warning_level)
+    img.paste(cell_img, (cell.x, cell.y))
 
-    draw.text((text_x, text_y), formatted_value, font=text_font, fill=fg_color)
 
+# DEBUG_BORDERS can't change while running, so only wrap draw_cell with a border when it's set
+if DEBUG_BORDERS:
+    _draw_cell_content = draw_cell
 
-def generate_display_image(sensor_data):
-    """Generate a 1-bit image for the Badger2040 display."""
-    width = DISPLAY_CONFIG["width"]
-    height = DISPLAY_CONFIG["height"]
-    cols = DISPLAY_CONFIG["cols"]
-    rows = DISPLAY_CONFIG["rows"]
+    def draw_cell(img, cell, value):
+        """Draw a single cell in the grid, outlined with a debug border."""
+        _draw_cell_content(img, cell, value)
+        ImageDraw.Draw(img).rectangle(cell.box, outline=0, width=1)
 
-    # Create white background image
-    img = Image.new("1", (width, height), 1)
-    draw = ImageDraw.Draw(img)
 
-    # Load font
-    font_cfg = DISPLAY_CONFIG["fonts"]
-    try:
-        text_font = ImageFont.truetype(font_cfg["text"]["path"], font_cfg["text"]["size"])
-    except OSError:
-        text_font = ImageFont.load_default()
+def generate_display_image(sensor_data, previous_img=None, previous_data=None):
+    """Generate a 1-bit image for the Badger2040 display.
 
-    # Calculate cell dimensions
-    cell_width = width // cols
-    cell_height = height // rows
+    If the previous image and the sensor data it was drawn from are given,
+    only the cells whose values changed are redrawn on a copy of it.
+    """
+    if previous_img is None or previous_data is None:
+        # Create white background image
+        img = Image.new("1", (DISPLAY_CONFIG["width"], DISPLAY_CONFIG["height"]), 1)
+        previous_data = None
 
-    # Draw each cell
-    for cell_config in GRID_CONFIG:
-        draw_cell(draw, img, cell_config, sensor_data, cell_width, cell_height, text_font, debug_borders=DEBUG_BORDERS)
+        # Blank cells never change, so they only need their border drawing once
+        if DEBUG_BORDERS:
+            draw = ImageDraw.Draw(img)
+            for cell in _BLANK_CELLS:
+                draw.rectangle(cell.box, outline=0, width=1)
+    else:
+        img = previous_img.copy()
+
+    # Draw each cell. Cells never draw outside their own box, so
+    # unchanged cells can be left as they are.
+    for cell in _CELLS:
+        value = sensor_data.get(cell.sensor, "---")
+        if previous_data is not None and value == previous_data.get(cell.sensor, "---"):
+            continue  # unchanged since the previous image
+
+        draw_cell(img, cell, value)
 
     return img
 
@@ -303,32 +430,114 @@ def generate_display_image(sensor_data):
 
 def image_to_badge_bytes(img):
     """Convert PIL image to packed bytes for Badger2040."""
-    img = img.convert("1")
-    pixels = list(img.get_flattened_data())
-    byte_data = bytearray()
-    width = DISPLAY_CONFIG["width"]
-    height = DISPLAY_CONFIG["height"]
-
-    for y in range(height):
-        for x in range(0, width, 8):
-            byte = 0
-            for bit in range(8):
-                px = x + bit
-                if px < width:
-                    if pixels[y * width + px]:
-                        byte |= 1 << (7 - bit)
-            byte_data.append(byte)
-
-    return bytes(byte_data)
+    # PIL packs mode "1" images MSB-first, one row after another, which is
+    # exactly the badge's layout as long as the width is a multiple of 8
+    return img.convert("1").tobytes("raw", "1")
+
+
+def find_changed_regions(old_img, new_img):
+    """Return an (x, y, w, h) region for each cell that changed, empty if nothing changed."""
+    diff = ImageChops.logical_xor(old_img, new_img)
+    if diff.getbbox() is None:
+        return []
+
+    regions = []
+    for cell in _ALL_CELLS:
+        if diff.crop((cell.x, cell.y, cell.x + cell.w, cell.y + cell.h)).getbbox() is None:
+            continue
+
+        # Widen to whole bytes since cell edges don't necessarily fall on a byte boundary
+        x0 = cell.x // 8 * 8
+        x1 = min(DISPLAY_CONFIG["width"], (cell.x + cell.w + 7) // 8 * 8)
+        regions.append((x0, cell.y, x1 - x0, cell.h))
+    return regions
+
+
+def encode_frame(raw_tag, rle_tag, header, payload):
+    """Build a binary frame, run-length encoding the payload when that makes it smaller.
+
+    A frame is a tag, a big-endian header ending in the payload length,
+    then the payload itself and a newline.
+    """
+    encoded = rle_encode(payload)
+    if len(encoded) < len(payload):
+        return rle_tag + header + struct.pack(">H", len(encoded)) + encoded + b"\n"
+    return raw_tag + header + struct.pack(">H", len(payload)) + payload + b"\n"
+
+
+def rle_encode(data):
+    """Run-length encode bytes, PackBits style.
+
+    Each control byte n of 0-127 is followed by n + 1 literal bytes, and
+    each of 129-255 by a single byte that repeats 257 - n times.
+    """
+    encoded = bytearray()
+    length = len(data)
+    i = 0
+    while i < length:
+        # Runs of three or more identical bytes are worth encoding as a repeat
+        run_end = i + 1
+        while run_end < length and run_end - i < 128 and data[run_end] == data[i]:
+            run_end += 1
+        if run_end - i >= 3:
+            encoded.append(257 - (run_end - i))
+            encoded.append(data[i])
+            i = run_end
+            continue
+
+        # Otherwise copy bytes literally up to the start of the next run
+        literal_end = i
+        while literal_end < length and literal_end - i < 128 and not (
+            literal_end + 2 < length and data[literal_end] == data[literal_end + 1] == data[literal_end + 2]
+        ):
+            literal_end += 1
+        encoded.append(literal_end - i - 1)
+        encoded += data[i:literal_end]
+        i = literal_end
+    return bytes(encoded)
+
+
+# Last frame sent to the badge, used to send only the cells that changed
+_last_frame = None
+# Frames sent since the last full refresh
+_frames_since_full_refresh = 0
 
 
 def send_image_to_badge(ser, img):
-    """Send image to badge over serial."""
-    img_bytes = image_to_badge_bytes(img)
-    encoded = base64.b64encode(img_bytes).decode("ascii")
-    ser.write(b"IMG:")
-    ser.write(encoded.encode("ascii"))
-    ser.write(b"\n")
+    """Send image to badge over serial, as patches of the changed cells when possible."""
+    global _last_frame, _frames_since_full_refresh
+
+    img = img.convert("1")
+    regions = None
+    if _last_frame is not None:
+        regions = find_changed_regions(_last_frame, img)
+        if not regions:
+            return  # Nothing changed since the last frame
+
+    _last_frame = img
+
+    # Periodically, and whenever every cell changed, send the full frame
+    # with a normal-speed refresh to clear ghosting
+    _frames_since_full_refresh += 1
+    if _frames_since_full_refresh >= FULL_REFRESH_INTERVAL or (regions and len(regions) >= len(_CELLS)):
+        regions = None
+
+    # Full frames are IMGB, patches are IMGP with their x, y, w, h,
+    # or IMGR/IMPR when run-length encoded
+    if regions is None:
+        message = b"MODE:NORMAL\n" + encode_frame(b"IMGB:", b"IMGR:", b"", image_to_badge_bytes(img))
+        _frames_since_full_refresh = 0
+    else:
+        message = b"".join(
+            encode_frame(
+                b"IMGP:", b"IMPR:", struct.pack(">HHHH", x, y, w, h),
+                image_to_badge_bytes(img.crop((x, y, x + w, y + h))),
+            )
+            for x, y, w, h in regions
+        )
+
+    # Write everything at once to avoid a separate USB transfer per piece
+    ser.write(message)
     ser.flush()
 
 
@@ -345,27 +554,59 @@ except Exception as e:
     print("Make sure Thonny is closed and badge is connected!")
     exit(1)
 
-print("Sensor Monitor started. Press Ctrl+C to stop.")
 
-def wait_for_next_minute():
-    """Sleep until the start of the next minute."""
-    now = time.time()
-    seconds_until_next_minute = 60 - (now % 60)
-    time.sleep(seconds_until_next_minute)
+async def fetcher_loop(queue):
+    """Fetch sensor data on every refresh and hand it to the renderer."""
+    refresh_interval = 10 if DEBUG_FAST_REFRESH else 60
+
+    # Schedule against absolute deadlines so the time spent fetching
+    # doesn't push each refresh later than the last
+    next_tick = math.ceil(time.time() / refresh_interval) * refresh_interval
 
-try:
     while True:
-        sensor_data = fetch_all_sensors()
+        sensor_data = await asyncio.to_thread(fetch_all_sensors)
         print(f"[{sensor_data['time']}] CO2: {sensor_data['co2']}, CO: {sensor_data['co']}, PM2.5: {sensor_data['pm25']}, "
               f"Temp: {sensor_data['temperature']}°C, Humidity: {sensor_data['humidity']}%, Outside: {sensor_data['outside_temp']}°C")
 
-        img = generate_display_image(sensor_data)
-        send_image_to_badge(ser, img)
+        # Only the newest data is worth drawing, so replace any the renderer hasn't taken yet
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(sensor_data)
+
+        await asyncio.sleep(max(0, next_tick - time.time()))
+        next_tick += refresh_interval
 
-        if DEBUG_FAST_REFRESH:
-            time.sleep(10)
-        else:
-            wait_for_next_minute()
+        # Skip any deadlines missed while busy or asleep rather than catching up
+        while next_tick <= time.time():
+            next_tick += refresh_interval
+
+
+async def render_send_loop(ser, queue):
+    """Render each new set of sensor data and send it to the badge."""
+    img = None
+    last_sensor_data = None
+
+    while True:
+        sensor_data = await queue.get()
+
+        # Skip rendering entirely when nothing changed, otherwise redraw only the changed cells.
+        # PIL and pyserial block, so run them off the event loop.
+        if sensor_data != last_sensor_data:
+            img = await asyncio.to_thread(generate_display_image, sensor_data, img, last_sensor_data)
+            await asyncio.to_thread(send_image_to_badge, ser, img)
+            last_sensor_data = sensor_data
+
+
+async def run(ser):
+    """Run fetching and rendering/sending concurrently, so neither waits on the other."""
+    queue = asyncio.Queue(maxsize=1)
+    await asyncio.gather(fetcher_loop(queue), render_send_loop(ser, queue))
+
+
+print("Sensor Monitor started. Press Ctrl+C to stop.")
+
+try:
+    asyncio.run(run(ser))
 
 except KeyboardInterrupt:
     print("\nStopping sensor monitor...")